@@ -41,6 +41,8 @@ def main():
                         help='dataset type; when set to email-eu, --file is treated as a directory')
     parser.add_argument('--max-size', type=int, default=4, help='max hyperedge size to load')
     parser.add_argument('--repeat', type=int, default=1, help='number of repeats for timing')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='worker processes for the baseline when numba is not available')
     args = parser.parse_args()
 
     # attempt to load DBLP
@@ -71,7 +73,7 @@ def main():
     print('Hyperedges:', len(H.edges))
 
     # baseline k=3
-    counts3_base, t3_base = time_fn(baseline_count, H, 3, repeat=args.repeat)
+    counts3_base, t3_base = time_fn(baseline_count, H, 3, args.workers, repeat=args.repeat)
     print(f'Baseline k=3: {sum(counts3_base.values())} motifs, time={t3_base:.6f}s')
 
     # efficient order-3
@@ -79,7 +81,7 @@ def main():
     print(f'Efficient order-3: {sum(counts3_eff.values())} motifs, time={t3_eff:.6f}s')
 
     #baseline k=4
-    counts4_base, t4_base = time_fn(baseline_count, H, 4, repeat=args.repeat)
+    counts4_base, t4_base = time_fn(baseline_count, H, 4, args.workers, repeat=args.repeat)
     print(f'Baseline k=4: {sum(counts4_base.values())} motifs, time={t4_base:.6f}s')
 
     # efficient order-4
@@ -0,0 +1,17 @@
+"""Regenerate src/_motif_classes.py, the stored motif class table.
+
+Runs the brute-force canonicalizer once per motif class on at most 4
+vertices and writes one signature and the canonical form of each class.
+Only needed if the canonical form format changes.
+"""
+import os
+import sys
+
+# make repo root importable
+sys.path.insert(0, os.path.abspath('.'))
+
+from src.hypergraph_motifs import write_class_module
+
+
+if __name__ == '__main__':
+    write_class_module(os.path.join('src', '_motif_classes.py'))
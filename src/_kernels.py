@@ -0,0 +1,216 @@
+"""Numba kernels for the motif counting hot paths.
+
+Graphs are passed in CSR form (`indptr`, `indices` as int32 arrays, see
+`csr_from_adjacency` in `hypergraph_motifs`). This module requires numba;
+`hypergraph_motifs` falls back to its pure-Python implementations when the
+import fails.
+"""
+import numba
+from numba import get_num_threads  # re-exported to size `esu_count_csr` chunks
+import numpy as np
+
+
+@numba.njit(cache=True)
+def _esu_workspace(indptr, k):
+    """Allocate the per-thread scratch arrays used by `_esu_root`."""
+    n = indptr.shape[0] - 1
+    max_deg = 0
+    for v in range(n):
+        d = indptr[v + 1] - indptr[v]
+        if d > max_deg:
+            max_deg = d
+    ext = np.empty((k, k * max_deg + 1), np.int32)
+    elen = np.zeros(k, np.int32)
+    sub = np.empty(k, np.int32)
+    mark = np.zeros(n, np.int32)
+    return ext, elen, sub, mark
+
+
+@numba.njit(cache=True)
+def _unmark(indptr, indices, mark, w):
+    mark[w] -= 1
+    for p in range(indptr[w], indptr[w + 1]):
+        mark[indices[p]] -= 1
+
+
+@numba.njit(cache=True)
+def _esu_root(indptr, indices, root, out_buf, rows, ext, elen, sub, mark):
+    """Write every connected k-set whose smallest vertex is root into out_buf.
+
+    Rows are written from index `rows` on (out_buf has shape (cap, k),
+    k >= 2). Extension sets are kept as one int32 array per depth, and
+    `mark` counts how many subgraph vertices have each vertex in their
+    closed neighbourhood, so the exclusive neighbourhood test of ESU is a
+    single array read. Returns the new row count, or -1 when out_buf is too
+    small; `mark` is left all zeros in both cases.
+    """
+    cap, k = out_buf.shape
+    sub[0] = root
+    mark[root] += 1
+    m = 0
+    for p in range(indptr[root], indptr[root + 1]):
+        u = indices[p]
+        mark[u] += 1
+        if u > root:
+            ext[1, m] = u
+            m += 1
+    elen[1] = m
+    depth = 1
+    while depth > 0:
+        if depth == k - 1:
+            # leaf level: every extension vertex completes a k-set
+            if rows + elen[depth] > cap:
+                for d in range(depth):
+                    _unmark(indptr, indices, mark, sub[d])
+                return -1
+            for i in range(elen[depth]):
+                for j in range(depth):
+                    out_buf[rows, j] = sub[j]
+                out_buf[rows, depth] = ext[depth, i]
+                rows += 1
+            elen[depth] = 0
+        if elen[depth] == 0:
+            # backtrack: drop the last subgraph vertex
+            depth -= 1
+            _unmark(indptr, indices, mark, sub[depth])
+            continue
+        elen[depth] -= 1
+        w = ext[depth, elen[depth]]
+        m = elen[depth]
+        for i in range(m):
+            ext[depth + 1, i] = ext[depth, i]
+        for p in range(indptr[w], indptr[w + 1]):
+            u = indices[p]
+            if u > root and mark[u] == 0:
+                ext[depth + 1, m] = u
+                m += 1
+        elen[depth + 1] = m
+        sub[depth] = w
+        mark[w] += 1
+        for p in range(indptr[w], indptr[w + 1]):
+            mark[indices[p]] += 1
+        depth += 1
+    return rows
+
+
+@numba.njit(cache=True)
+def esu_csr(indptr, indices, root, out_buf):
+    """ESU enumeration of connected k-vertex sets over CSR adjacency.
+
+    Roots root, root+1, ... are processed in order and each connected
+    k-set whose smallest vertex is the root is written as a row of
+    `out_buf` (shape (cap, k)).
+
+    Returns (rows, next_root). Rows are only ever emitted for complete
+    roots: when out_buf fills up, the rows of the unfinished root are
+    dropped and next_root is that root, so the caller can flush and resume.
+    rows == 0 with next_root < n means a single root needs a bigger buffer.
+    """
+    n = indptr.shape[0] - 1
+    ext, elen, sub, mark = _esu_workspace(indptr, out_buf.shape[1])
+    rows = 0
+    while root < n:
+        new_rows = _esu_root(indptr, indices, root, out_buf, rows, ext, elen, sub, mark)
+        if new_rows < 0:
+            return rows, root
+        rows = new_rows
+        root += 1
+    return rows, root
+
+
+@numba.njit(cache=True)
+def _count_chunk(indptr, indices, vptr, vedges, eptr, everts, k, slot, lut, counts, c, n_chunks):
+    """Add the class counts of roots c, c+n_chunks, ... to counts (see `esu_count_csr`)."""
+    n = indptr.shape[0] - 1
+    ext, elen, sub, mark = _esu_workspace(indptr, k)
+    pos = np.full(n, -1, np.int32)
+    buf = np.empty((1024, k), np.int32)
+    for root in range(c, n, n_chunks):
+        rows = _esu_root(indptr, indices, root, buf, 0, ext, elen, sub, mark)
+        while rows < 0:
+            buf = np.empty((2 * buf.shape[0], k), np.int32)
+            rows = _esu_root(indptr, indices, root, buf, 0, ext, elen, sub, mark)
+        for r in range(rows):
+            for i in range(k):
+                pos[buf[r, i]] = i
+            code = 0
+            for i in range(k):
+                v = buf[r, i]
+                for q in range(vptr[v], vptr[v + 1]):
+                    e = vedges[q]
+                    if eptr[e + 1] - eptr[e] > k:
+                        continue
+                    mask = 0
+                    for t in range(eptr[e], eptr[e + 1]):
+                        b = pos[everts[t]]
+                        if b < 0:
+                            mask = 0
+                            break
+                        mask |= 1 << b
+                    if mask:
+                        code |= 1 << slot[mask]
+            cid = lut[code]
+            if cid >= 0:
+                counts[cid] += 1
+            for i in range(k):
+                pos[buf[r, i]] = -1
+
+
+@numba.njit(parallel=True, cache=True)
+def esu_count_csr(indptr, indices, vptr, vedges, eptr, everts, k, slot, lut, n_classes, n_chunks):
+    """Count motif classes over all connected k-sets, in parallel over roots.
+
+    indptr/indices is the projection; vptr/vedges lists the edges incident
+    to each vertex and eptr/everts the vertices of each edge. For each
+    k-set the induced edges are reduced to a code with bit slot[mask] set
+    for every edge mask over the set's k positions, and lut[code] is its
+    class id (-1 when the edges do not connect all k vertices). Needs a
+    hypergraph without repeated or single-vertex edges, which the code
+    cannot tell apart.
+
+    Roots are dealt round-robin to n_chunks chunks, each with its own
+    scratch arrays and row of counts; the rows are summed at the end.
+    """
+    counts = np.zeros((n_chunks, n_classes), np.int64)
+    for c in numba.prange(n_chunks):
+        _count_chunk(indptr, indices, vptr, vedges, eptr, everts, k, slot, lut,
+                     counts[c], c, n_chunks)
+    return counts.sum(axis=0)
+
+
+@numba.njit(cache=True)
+def triples_csr(indptr, indices, root, out_buf):
+    """Enumerate connected 3-vertex sets over CSR adjacency.
+
+    Same calling convention as `esu_csr` with out_buf of shape (cap, 3),
+    but rows are grouped by centre vertex instead of smallest vertex. For
+    each centre v and neighbour u, the rest of v's sorted row is merged
+    with u's sorted row: a common neighbour w closes a triangle, emitted
+    only when v is its smallest vertex; any other w forms an open wedge
+    u-v-w, which has v as its unique centre.
+    """
+    n = indptr.shape[0] - 1
+    cap = out_buf.shape[0]
+    rows = 0
+    while root < n:
+        root_rows = rows
+        lo = indptr[root]
+        hi = indptr[root + 1]
+        for i in range(lo, hi):
+            u = indices[i]
+            p = indptr[u]
+            p_end = indptr[u + 1]
+            for j in range(i + 1, hi):
+                w = indices[j]
+                while p < p_end and indices[p] < w:
+                    p += 1
+                if p < p_end and indices[p] == w and root > u:
+                    continue
+                if rows == cap:
+                    return root_rows, root
+                out_buf[rows, 0] = u
+                out_buf[rows, 1] = root
+                out_buf[rows, 2] = w
+                rows += 1
+        root += 1
+    return rows, root
@@ -0,0 +1,371 @@
+"""Motif classes on at most 4 vertices.
+
+Generated by scripts/generate_motif_classes.py; do not edit.
+CLASS_SIGNATURES[i] is one signature (sorted tuple of edge bitmasks)
+of class i and CLASS_NAMES[i] its canonical form.
+"""
+CLASS_SIGNATURES = [
+    (),
+    (3,),
+    (7,),
+    (15,),
+    (3, 5),
+    (3, 7),
+    (3, 12),
+    (3, 13),
+    (3, 15),
+    (7, 11),
+    (7, 15),
+    (3, 5, 6),
+    (3, 5, 7),
+    (3, 5, 9),
+    (3, 5, 10),
+    (3, 5, 11),
+    (3, 5, 14),
+    (3, 5, 15),
+    (3, 7, 11),
+    (3, 7, 12),
+    (3, 7, 13),
+    (3, 7, 15),
+    (3, 12, 15),
+    (3, 13, 14),
+    (3, 13, 15),
+    (7, 11, 13),
+    (7, 11, 15),
+    (3, 5, 6, 7),
+    (3, 5, 6, 9),
+    (3, 5, 6, 11),
+    (3, 5, 6, 15),
+    (3, 5, 7, 9),
+    (3, 5, 7, 10),
+    (3, 5, 7, 11),
+    (3, 5, 7, 14),
+    (3, 5, 7, 15),
+    (3, 5, 9, 14),
+    (3, 5, 9, 15),
+    (3, 5, 10, 12),
+    (3, 5, 10, 13),
+    (3, 5, 10, 15),
+    (3, 5, 11, 13),
+    (3, 5, 11, 14),
+    (3, 5, 11, 15),
+    (3, 5, 14, 15),
+    (3, 7, 11, 12),
+    (3, 7, 11, 13),
+    (3, 7, 11, 15),
+    (3, 7, 12, 13),
+    (3, 7, 12, 15),
+    (3, 7, 13, 14),
+    (3, 7, 13, 15),
+    (3, 13, 14, 15),
+    (7, 11, 13, 14),
+    (7, 11, 13, 15),
+    (3, 5, 6, 7, 9),
+    (3, 5, 6, 7, 11),
+    (3, 5, 6, 7, 15),
+    (3, 5, 6, 9, 10),
+    (3, 5, 6, 9, 11),
+    (3, 5, 6, 9, 14),
+    (3, 5, 6, 9, 15),
+    (3, 5, 6, 11, 13),
+    (3, 5, 6, 11, 15),
+    (3, 5, 7, 9, 11),
+    (3, 5, 7, 9, 14),
+    (3, 5, 7, 9, 15),
+    (3, 5, 7, 10, 11),
+    (3, 5, 7, 10, 12),
+    (3, 5, 7, 10, 13),
+    (3, 5, 7, 10, 14),
+    (3, 5, 7, 10, 15),
+    (3, 5, 7, 11, 13),
+    (3, 5, 7, 11, 14),
+    (3, 5, 7, 11, 15),
+    (3, 5, 7, 14, 15),
+    (3, 5, 9, 14, 15),
+    (3, 5, 10, 12, 15),
+    (3, 5, 10, 13, 14),
+    (3, 5, 10, 13, 15),
+    (3, 5, 11, 13, 14),
+    (3, 5, 11, 13, 15),
+    (3, 5, 11, 14, 15),
+    (3, 7, 11, 12, 13),
+    (3, 7, 11, 12, 15),
+    (3, 7, 11, 13, 14),
+    (3, 7, 11, 13, 15),
+    (3, 7, 12, 13, 15),
+    (3, 7, 13, 14, 15),
+    (7, 11, 13, 14, 15),
+    (3, 5, 6, 7, 9, 10),
+    (3, 5, 6, 7, 9, 11),
+    (3, 5, 6, 7, 9, 14),
+    (3, 5, 6, 7, 9, 15),
+    (3, 5, 6, 7, 11, 13),
+    (3, 5, 6, 7, 11, 15),
+    (3, 5, 6, 9, 10, 12),
+    (3, 5, 6, 9, 10, 13),
+    (3, 5, 6, 9, 10, 15),
+    (3, 5, 6, 9, 11, 13),
+    (3, 5, 6, 9, 11, 14),
+    (3, 5, 6, 9, 11, 15),
+    (3, 5, 6, 9, 14, 15),
+    (3, 5, 6, 11, 13, 14),
+    (3, 5, 6, 11, 13, 15),
+    (3, 5, 7, 9, 11, 13),
+    (3, 5, 7, 9, 11, 14),
+    (3, 5, 7, 9, 11, 15),
+    (3, 5, 7, 9, 14, 15),
+    (3, 5, 7, 10, 11, 12),
+    (3, 5, 7, 10, 11, 13),
+    (3, 5, 7, 10, 11, 15),
+    (3, 5, 7, 10, 12, 14),
+    (3, 5, 7, 10, 12, 15),
+    (3, 5, 7, 10, 13, 14),
+    (3, 5, 7, 10, 13, 15),
+    (3, 5, 7, 10, 14, 15),
+    (3, 5, 7, 11, 13, 14),
+    (3, 5, 7, 11, 13, 15),
+    (3, 5, 7, 11, 14, 15),
+    (3, 5, 10, 13, 14, 15),
+    (3, 5, 11, 13, 14, 15),
+    (3, 7, 11, 12, 13, 14),
+    (3, 7, 11, 12, 13, 15),
+    (3, 7, 11, 13, 14, 15),
+    (3, 5, 6, 7, 9, 10, 11),
+    (3, 5, 6, 7, 9, 10, 12),
+    (3, 5, 6, 7, 9, 10, 13),
+    (3, 5, 6, 7, 9, 10, 15),
+    (3, 5, 6, 7, 9, 11, 13),
+    (3, 5, 6, 7, 9, 11, 14),
+    (3, 5, 6, 7, 9, 11, 15),
+    (3, 5, 6, 7, 9, 14, 15),
+    (3, 5, 6, 7, 11, 13, 14),
+    (3, 5, 6, 7, 11, 13, 15),
+    (3, 5, 6, 9, 10, 12, 15),
+    (3, 5, 6, 9, 10, 13, 14),
+    (3, 5, 6, 9, 10, 13, 15),
+    (3, 5, 6, 9, 11, 13, 14),
+    (3, 5, 6, 9, 11, 13, 15),
+    (3, 5, 6, 9, 11, 14, 15),
+    (3, 5, 6, 11, 13, 14, 15),
+    (3, 5, 7, 9, 11, 13, 14),
+    (3, 5, 7, 9, 11, 13, 15),
+    (3, 5, 7, 9, 11, 14, 15),
+    (3, 5, 7, 10, 11, 12, 13),
+    (3, 5, 7, 10, 11, 12, 15),
+    (3, 5, 7, 10, 11, 13, 14),
+    (3, 5, 7, 10, 11, 13, 15),
+    (3, 5, 7, 10, 12, 14, 15),
+    (3, 5, 7, 10, 13, 14, 15),
+    (3, 5, 7, 11, 13, 14, 15),
+    (3, 7, 11, 12, 13, 14, 15),
+    (3, 5, 6, 7, 9, 10, 11, 12),
+    (3, 5, 6, 7, 9, 10, 11, 13),
+    (3, 5, 6, 7, 9, 10, 11, 15),
+    (3, 5, 6, 7, 9, 10, 12, 15),
+    (3, 5, 6, 7, 9, 10, 13, 14),
+    (3, 5, 6, 7, 9, 10, 13, 15),
+    (3, 5, 6, 7, 9, 11, 13, 14),
+    (3, 5, 6, 7, 9, 11, 13, 15),
+    (3, 5, 6, 7, 9, 11, 14, 15),
+    (3, 5, 6, 7, 11, 13, 14, 15),
+    (3, 5, 6, 9, 10, 13, 14, 15),
+    (3, 5, 6, 9, 11, 13, 14, 15),
+    (3, 5, 7, 9, 11, 13, 14, 15),
+    (3, 5, 7, 10, 11, 12, 13, 14),
+    (3, 5, 7, 10, 11, 12, 13, 15),
+    (3, 5, 7, 10, 11, 13, 14, 15),
+    (3, 5, 6, 7, 9, 10, 11, 12, 13),
+    (3, 5, 6, 7, 9, 10, 11, 12, 15),
+    (3, 5, 6, 7, 9, 10, 11, 13, 14),
+    (3, 5, 6, 7, 9, 10, 11, 13, 15),
+    (3, 5, 6, 7, 9, 10, 13, 14, 15),
+    (3, 5, 6, 7, 9, 11, 13, 14, 15),
+    (3, 5, 7, 10, 11, 12, 13, 14, 15),
+    (3, 5, 6, 7, 9, 10, 11, 12, 13, 14),
+    (3, 5, 6, 7, 9, 10, 11, 12, 13, 15),
+    (3, 5, 6, 7, 9, 10, 11, 13, 14, 15),
+    (3, 5, 6, 7, 9, 10, 11, 12, 13, 14, 15),
+]
+
+CLASS_NAMES = [
+    '()',
+    '[[0, 1]]',
+    '[[0, 1, 2]]',
+    '[[0, 1, 2, 3]]',
+    '[[0, 1], [0, 2]]',
+    '[[0, 1], [0, 1, 2]]',
+    '[[0, 1], [2, 3]]',
+    '[[0, 1], [0, 2, 3]]',
+    '[[0, 1], [0, 1, 2, 3]]',
+    '[[0, 1, 2], [0, 1, 3]]',
+    '[[0, 1, 2], [0, 1, 2, 3]]',
+    '[[0, 1], [0, 2], [1, 2]]',
+    '[[0, 1], [0, 1, 2], [0, 2]]',
+    '[[0, 1], [0, 2], [0, 3]]',
+    '[[0, 1], [0, 2], [1, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 3]]',
+    '[[0, 1], [0, 2], [1, 2, 3]]',
+    '[[0, 1], [0, 1, 2, 3], [0, 2]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 3]]',
+    '[[0, 1], [0, 1, 2], [2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3]]',
+    '[[0, 1], [0, 1, 2, 3], [2, 3]]',
+    '[[0, 1], [0, 2, 3], [1, 2, 3]]',
+    '[[0, 1], [0, 1, 2, 3], [0, 2, 3]]',
+    '[[0, 1, 2], [0, 1, 3], [0, 2, 3]]',
+    '[[0, 1, 2], [0, 1, 2, 3], [0, 1, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 2], [1, 2]]',
+    '[[0, 1], [0, 2], [0, 3], [1, 2]]',
+    '[[0, 1], [0, 1, 2], [0, 3], [1, 3]]',
+    '[[0, 1], [0, 1, 2, 3], [0, 2], [1, 2]]',
+    '[[0, 1], [0, 1, 2], [0, 2], [0, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 2], [1, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 3], [0, 2]]',
+    '[[0, 1], [0, 1, 2], [0, 2], [1, 2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 2]]',
+    '[[0, 1], [0, 2], [0, 3], [1, 2, 3]]',
+    '[[0, 1], [0, 1, 2, 3], [0, 2], [0, 3]]',
+    '[[0, 1], [0, 2], [1, 3], [2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 3], [2, 3]]',
+    '[[0, 1], [0, 1, 2, 3], [0, 2], [1, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 2, 3], [0, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 2, 3], [1, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 3]]',
+    '[[0, 1], [0, 1, 2, 3], [0, 2], [1, 2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 3], [2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 3], [0, 2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 1, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 2, 3], [2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 2, 3], [1, 2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 2, 3]]',
+    '[[0, 1], [0, 1, 2, 3], [0, 2, 3], [1, 2, 3]]',
+    '[[0, 1, 2], [0, 1, 3], [0, 2, 3], [1, 2, 3]]',
+    '[[0, 1, 2], [0, 1, 2, 3], [0, 1, 3], [0, 2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 2], [0, 3], [1, 2]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 3], [0, 2], [1, 2]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 2], [1, 2]]',
+    '[[0, 1], [0, 2], [0, 3], [1, 2], [1, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 2], [0, 3], [1, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 3], [1, 3], [2, 3]]',
+    '[[0, 1], [0, 1, 2, 3], [0, 2], [0, 3], [1, 2]]',
+    '[[0, 1], [0, 1, 2], [0, 2, 3], [0, 3], [1, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 3], [1, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 3], [0, 2], [0, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 2], [0, 3], [1, 2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 2], [0, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 3], [0, 2], [1, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 2], [1, 3], [2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 3], [0, 2], [2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 2], [1, 2, 3], [1, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 2], [1, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 3], [0, 2], [0, 2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 3], [0, 2], [1, 2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 1, 3], [0, 2]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 2], [1, 2, 3]]',
+    '[[0, 1], [0, 1, 2, 3], [0, 2], [0, 3], [1, 2, 3]]',
+    '[[0, 1], [0, 1, 2, 3], [0, 2], [1, 3], [2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 2, 3], [1, 3], [2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 3], [2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 2, 3], [0, 3], [1, 2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 2, 3], [0, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 2, 3], [1, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 3], [0, 2, 3], [2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 1, 3], [2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 3], [0, 2, 3], [1, 2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 1, 3], [0, 2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 2, 3], [2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 2, 3], [1, 2, 3]]',
+    '[[0, 1, 2], [0, 1, 2, 3], [0, 1, 3], [0, 2, 3], [1, 2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 2], [0, 3], [1, 2], [1, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 3], [0, 2], [0, 3], [1, 2]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 3], [0, 2], [1, 2], [2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 2], [0, 3], [1, 2]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 3], [0, 2], [0, 2, 3], [1, 2]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 1, 3], [0, 2], [1, 2]]',
+    '[[0, 1], [0, 2], [0, 3], [1, 2], [1, 3], [2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 2], [0, 3], [1, 3], [2, 3]]',
+    '[[0, 1], [0, 1, 2, 3], [0, 2], [0, 3], [1, 2], [1, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 3], [0, 2], [0, 3], [2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 2], [0, 3], [1, 2, 3], [1, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 2], [0, 3], [1, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 3], [1, 3], [2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 2, 3], [0, 3], [1, 2, 3], [1, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 2, 3], [0, 3], [1, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 3], [0, 2], [0, 2, 3], [0, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 3], [0, 2], [0, 3], [1, 2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 1, 3], [0, 2], [0, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 2], [0, 3], [1, 2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 3], [0, 2], [1, 3], [2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 3], [0, 2], [0, 2, 3], [1, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 1, 3], [0, 2], [1, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 2], [1, 2, 3], [1, 3], [2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 2], [1, 3], [2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 3], [0, 2], [1, 2, 3], [2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 1, 3], [0, 2], [2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 2], [1, 2, 3], [1, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 3], [0, 2], [0, 2, 3], [1, 2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 1, 3], [0, 2], [0, 2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 1, 3], [0, 2], [1, 2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 2, 3], [1, 3], [2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 2, 3], [0, 3], [1, 2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 3], [0, 2, 3], [1, 2, 3], [2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 1, 3], [0, 2, 3], [2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 1, 3], [0, 2, 3], [1, 2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 3], [0, 2], [0, 3], [1, 2], [1, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 2], [0, 3], [1, 2], [1, 3], [2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 3], [0, 2], [0, 3], [1, 2], [2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 2], [0, 3], [1, 2], [1, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 3], [0, 2], [0, 2, 3], [0, 3], [1, 2]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 3], [0, 2], [0, 2, 3], [1, 2], [1, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 1, 3], [0, 2], [0, 3], [1, 2]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 1, 3], [0, 2], [1, 2], [2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 3], [0, 2], [0, 2, 3], [1, 2], [1, 2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 1, 3], [0, 2], [0, 2, 3], [1, 2]]',
+    '[[0, 1], [0, 1, 2, 3], [0, 2], [0, 3], [1, 2], [1, 3], [2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 2], [0, 3], [1, 2, 3], [1, 3], [2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 2], [0, 3], [1, 3], [2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 3], [0, 2], [0, 3], [1, 2, 3], [2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 1, 3], [0, 2], [0, 3], [2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 2], [0, 3], [1, 2, 3], [1, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 2, 3], [0, 3], [1, 2, 3], [1, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 3], [0, 2], [0, 2, 3], [0, 3], [1, 2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 1, 3], [0, 2], [0, 2, 3], [0, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 1, 3], [0, 2], [0, 3], [1, 2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 3], [0, 2], [0, 2, 3], [1, 3], [2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 1, 3], [0, 2], [1, 3], [2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 3], [0, 2], [0, 2, 3], [1, 2, 3], [1, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 1, 3], [0, 2], [0, 2, 3], [1, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 2], [1, 2, 3], [1, 3], [2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 1, 3], [0, 2], [1, 2, 3], [2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 1, 3], [0, 2], [0, 2, 3], [1, 2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 1, 3], [0, 2, 3], [1, 2, 3], [2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 3], [0, 2], [0, 3], [1, 2], [1, 3], [2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 3], [0, 2], [0, 2, 3], [0, 3], [1, 2], [1, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 1, 3], [0, 2], [0, 3], [1, 2], [1, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 2], [0, 3], [1, 2], [1, 3], [2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 3], [0, 2], [0, 2, 3], [1, 2], [1, 3], [2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 1, 3], [0, 2], [0, 3], [1, 2], [2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 3], [0, 2], [0, 2, 3], [0, 3], [1, 2], [1, 2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 1, 3], [0, 2], [0, 2, 3], [0, 3], [1, 2]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 1, 3], [0, 2], [0, 2, 3], [1, 2], [1, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 1, 3], [0, 2], [0, 2, 3], [1, 2], [1, 2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 2], [0, 3], [1, 2, 3], [1, 3], [2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 1, 3], [0, 2], [0, 3], [1, 2, 3], [2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 1, 3], [0, 2], [0, 2, 3], [0, 3], [1, 2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 3], [0, 2], [0, 2, 3], [1, 2, 3], [1, 3], [2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 1, 3], [0, 2], [0, 2, 3], [1, 3], [2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 1, 3], [0, 2], [0, 2, 3], [1, 2, 3], [1, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 3], [0, 2], [0, 2, 3], [0, 3], [1, 2], [1, 3], [2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 1, 3], [0, 2], [0, 3], [1, 2], [1, 3], [2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 3], [0, 2], [0, 2, 3], [0, 3], [1, 2], [1, 2, 3], [1, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 1, 3], [0, 2], [0, 2, 3], [0, 3], [1, 2], [1, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 1, 3], [0, 2], [0, 2, 3], [1, 2], [1, 3], [2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 1, 3], [0, 2], [0, 2, 3], [0, 3], [1, 2], [1, 2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 1, 3], [0, 2], [0, 2, 3], [1, 2, 3], [1, 3], [2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 3], [0, 2], [0, 2, 3], [0, 3], [1, 2], [1, 2, 3], [1, 3], [2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 1, 3], [0, 2], [0, 2, 3], [0, 3], [1, 2], [1, 3], [2, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 1, 3], [0, 2], [0, 2, 3], [0, 3], [1, 2], [1, 2, 3], [1, 3]]',
+    '[[0, 1], [0, 1, 2], [0, 1, 2, 3], [0, 1, 3], [0, 2], [0, 2, 3], [0, 3], [1, 2], [1, 2, 3], [1, 3], [2, 3]]',
+]
@@ -0,0 +1,57 @@
+"""Ahead-of-time build of the `_kernels` entry points.
+
+Running
+
+    python3 -m src._motif_native
+
+compiles the kernels with numba.pycc into an extension module
+`motif_native` next to this file. The extension only needs numpy at
+runtime, so `hypergraph_motifs` uses it when numba itself is not
+installed and there is nothing to JIT-compile on first call. With numba
+installed the JIT kernels are preferred: they are cached on disk after the
+first run and `esu_count_csr` runs in parallel, while the AOT build of it
+processes its chunks one after another.
+
+Building needs numba and a C compiler; importing this module needs numba.
+"""
+import os
+
+from numba.pycc import CC
+
+from ._kernels import _count_chunk, esu_csr as _esu_csr, triples_csr as _triples_csr
+import numpy as np
+
+cc = CC("motif_native")
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+_ENUM_SIG = "UniTuple(i8, 2)(i4[:], i4[:], i8, i4[:, :])"
+_COUNT_SIG = ("i8[:](i4[:], i4[:], i4[:], i4[:], i4[:], i4[:], "
+              "i8, i8[:], i8[:], i8, i8)")
+
+
+@cc.export("esu_csr", _ENUM_SIG)
+def esu_csr(indptr, indices, root, out_buf):
+    return _esu_csr(indptr, indices, root, out_buf)
+
+
+@cc.export("triples_csr", _ENUM_SIG)
+def triples_csr(indptr, indices, root, out_buf):
+    return _triples_csr(indptr, indices, root, out_buf)
+
+
+@cc.export("esu_count_csr", _COUNT_SIG)
+def esu_count_csr(indptr, indices, vptr, vedges, eptr, everts, k, slot, lut, n_classes, n_chunks):
+    counts = np.zeros(n_classes, np.int64)
+    for c in range(n_chunks):
+        _count_chunk(indptr, indices, vptr, vedges, eptr, everts, k, slot, lut,
+                     counts, c, n_chunks)
+    return counts
+
+
+@cc.export("get_num_threads", "i8()")
+def get_num_threads():
+    return 1
+
+
+if __name__ == "__main__":
+    cc.compile()
@@ -9,9 +9,13 @@ Functions:
 
 If the file is missing, the loader does not raise but returns None.
 """
+from collections import defaultdict
 from typing import Optional
+import csv
 import os
 
+import numpy as np
+
 
 def load_dblp(file_path: str = 'data/dblp.csv', max_size: int = 4, Hypergraph=None):
     """Load DBLP-format CSV and return a Hypergraph instance.
@@ -31,35 +35,25 @@ def load_dblp(file_path: str = 'data/dblp.csv', max_size: int = 4, Hypergraph=No
     if not os.path.exists(file_path):
         return None
 
-    graph = {}
-    with open(file_path, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
-
-    for i, line in enumerate(lines):
-        if i == 0:
-            continue
-        l = line.strip()
-        if not l:
-            continue
-        parts = l.split(',')
-        if len(parts) < 2:
-            continue
-        # expecting paper,author,year (year optional)
-        paper = parts[0].strip()
-        author = parts[1].strip()
-        if paper in graph:
-            graph[paper].append(author)
-        else:
-            graph[paper] = [author]
+    graph = defaultdict(list)
+    with open(file_path, 'r', encoding='utf-8', newline='') as f:
+        # stream rows instead of reading the whole file into memory
+        reader = csv.reader(f)
+        next(reader, None)  # header
+        for parts in reader:
+            if len(parts) < 2:
+                continue
+            # expecting paper,author,year (year optional)
+            graph[parts[0].strip()].append(parts[1].strip())
 
     edges = set()
     for p, authors in graph.items():
-        tup = tuple(sorted(set(authors)))
-        if len(tup) > 1 and len(tup) <= max_size:
-            edges.add(tup)
+        e = frozenset(authors)
+        if len(e) > 1 and len(e) <= max_size:
+            edges.add(e)
 
     # build Hypergraph
-    H = Hypergraph(list(edges))
+    H = Hypergraph(list(edges), already_frozen=True)
     return H
 
 
@@ -90,33 +84,26 @@ def load_email_eu(dir_path: str = 'data/email-Eu', max_size: int = 4, Hypergraph
     if not os.path.exists(a_path) or not os.path.exists(b_path):
         return None
 
-    with open(a_path, 'r', encoding='utf-8') as fa:
-        v_lines = [line.strip() for line in fa if line.strip()]
-    with open(b_path, 'r', encoding='utf-8') as fb:
-        s_lines = [line.strip() for line in fb if line.strip()]
-
     try:
-        v = list(map(int, v_lines))
-        s = list(map(int, s_lines))
+        # parsed in C into int32 arrays rather than one Python int per line
+        v = np.loadtxt(a_path, dtype=np.int32, ndmin=1)
+        s = np.loadtxt(b_path, dtype=np.int32, ndmin=1)
     except ValueError:
         # unexpected format
         return None
 
     edges = set()
-    tot = set()
-
-    idx = 0
-    for count in v:
-        # take next `count` integers from s
-        if count <= 0:
-            e = ()
-        else:
-            block = s[idx: idx + count]
-            idx += count
-            e = tuple(sorted(block))
-        tot.add(e)
+
+    # simplices are tiny, so slicing a Python list beats per-row numpy calls
+    ends = np.cumsum(np.maximum(v, 0)).tolist()
+    s = s.tolist()
+    start = 0
+    for end in ends:
+        # the simplex is the run s[start:end]
+        e = frozenset(s[start:end])
+        start = end
         if len(e) > 1 and len(e) <= max_size:
             edges.add(e)
 
-    H = Hypergraph(list(edges))
+    H = Hypergraph(list(edges), already_frozen=True)
     return H
@@ -13,94 +13,366 @@ This file provides a compact Hypergraph class, projection to a graph
 (`2-section`), an ESU enumerator for connected k-node induced
 subgraphs of the projection, and hypergraph isomorphism by canonical
 labeling (brute force on k<=4 by permuting vertex labels).
+
+Counting never runs the brute-force canonicalizer per motif: each
+candidate is reduced to a signature (sorted tuple of edge bitmasks over
+its relabelled vertices) which is looked up in a table covering every
+edge set on at most 4 vertices. The table is expanded at import time
+from one stored signature per class (`src/_motif_classes.py`).
+
+When numba is installed, ESU runs as a compiled kernel over a CSR copy of
+the projection (see `src/_kernels.py`). Without numba the same kernels are
+taken from the ahead-of-time build `motif_native` if it has been compiled
+(`python3 -m src._motif_native`); otherwise the pure-Python enumerator is
+used.
 """
-from collections import defaultdict, deque
-from itertools import combinations, permutations
+from collections import Counter, defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, combinations, permutations
 import argparse
 import json
+import multiprocessing
 import sys
 
+import numpy as np
+
+try:
+    from ._motif_classes import CLASS_NAMES, CLASS_SIGNATURES
+except ImportError:  # run as a script
+    CLASS_NAMES = CLASS_SIGNATURES = None
+
+try:
+    from ._kernels import esu_count_csr, esu_csr, get_num_threads, triples_csr
+except ImportError:  # numba not installed, or run as a script
+    try:  # ahead-of-time build, see `src/_motif_native.py`
+        from .motif_native import esu_count_csr, esu_csr, get_num_threads, triples_csr
+    except ImportError:
+        esu_count_csr = esu_csr = get_num_threads = triples_csr = None
+
 
 class Hypergraph:
     """Simple hypergraph representation.
 
     vertices: set of hashable vertex ids
     edges: list of frozenset(vertex)
+    index: dict vertex -> dense id 0..n-1, in order of first appearance
+
+    Derived structures (incidence lists, size buckets, the projection and
+    its CSR forms) are built on first use and cached until the next
+    add_edge; callers must not modify the returned objects.
     """
 
-    def __init__(self, edges=None):
+    def __init__(self, edges=None, already_frozen=False):
+        """Build from an iterable of edges.
+
+        already_frozen=True promises that every edge is a non-empty
+        frozenset (as the loaders produce), so they are stored as given and
+        the vertex index is built in one pass instead of edge by edge.
+        """
         self.edges = []
         self.vertices = set()
-        if edges:
+        self.index = {}
+        self._clear_cache()
+        if edges and already_frozen:
+            self.edges = list(edges)
+            first_seen = dict.fromkeys(chain.from_iterable(self.edges))
+            self.index = {v: i for i, v in enumerate(first_seen)}
+            self.vertices = set(self.index)
+        elif edges:
             for e in edges:
                 self.add_edge(e)
 
+    def _clear_cache(self):
+        self._incidence = None
+        self._edges_by_size = None
+        self._proj = None
+        self._csr = None
+        self._incidence_csr = None
+
     def add_edge(self, edge):
         e = frozenset(edge)
         if len(e) == 0:
             return
         self.edges.append(e)
         self.vertices.update(e)
+        for v in e:
+            self.index.setdefault(v, len(self.index))
+        self._clear_cache()
+
+    @property
+    def incidence(self):
+        """dict vertex -> list of indices into edges"""
+        if self._incidence is None:
+            incidence = {}
+            for idx, e in enumerate(self.edges):
+                for v in e:
+                    incidence.setdefault(v, []).append(idx)
+            self._incidence = incidence
+        return self._incidence
+
+    @property
+    def edges_by_size(self):
+        """dict edge size -> list of indices into edges"""
+        if self._edges_by_size is None:
+            edges_by_size = {}
+            for idx, e in enumerate(self.edges):
+                edges_by_size.setdefault(len(e), []).append(idx)
+            self._edges_by_size = edges_by_size
+        return self._edges_by_size
 
     def induced_subhypergraph(self, vertex_subset):
         """Return a new Hypergraph induced by vertex_subset (iterable).
         Only edges entirely contained in the vertex subset are kept
-        (node-induced subhypergraph).
+        (node-induced subhypergraph). Only edges incident to the subset are
+        scanned, in their original order.
         """
         Vset = set(vertex_subset)
-        sub_edges = [e for e in self.edges if e.issubset(Vset)]
+        incidence = self.incidence
+        cand_edge_ids = set().union(*(incidence.get(v, ()) for v in Vset))
+        sub_edges = [self.edges[i] for i in sorted(cand_edge_ids) if self.edges[i] <= Vset]
         H = Hypergraph(sub_edges)
         return H
 
+    def induced_edges(self, vertex_subset):
+        """Return the edges induced by vertex_subset as bitmasks.
+
+        Vertices are labelled 0..k-1 in the iteration order of vertex_subset
+        and each edge entirely contained in the subset is returned as the
+        bitmask of its labels. Only edges incident to the subset are scanned.
+        """
+        pos = {v: i for i, v in enumerate(vertex_subset)}
+        incidence = self.incidence
+        masks = []
+        seen = set()
+        for v in pos:
+            for idx in incidence.get(v, ()):
+                if idx in seen:
+                    continue
+                seen.add(idx)
+                mask = 0
+                for u in self.edges[idx]:
+                    bit = pos.get(u)
+                    if bit is None:
+                        break
+                    mask |= 1 << bit
+                else:
+                    masks.append(mask)
+        return masks
+
     def projection_2_section(self):
         """Return the projection graph G as adjacency dict mapping vertex -> set(neighbors).
         Two vertices are adjacent if they appear together in at least one hyperedge.
+        Each hyperedge is merged into its members' neighbour sets with one
+        set union per member rather than one insert per vertex pair.
         """
+        if self._proj is not None:
+            return self._proj
         G = {v: set() for v in self.vertices}
         for e in self.edges:
-            for u, v in combinations(e, 2):
-                G[u].add(v)
-                G[v].add(u)
+            for v in e:
+                G[v].update(e)
+        for v, nbs in G.items():
+            nbs.discard(v)
+        self._proj = G
         return G
 
+    def to_csr(self):
+        """Return the projection graph in CSR form, built directly from the edges.
 
-def esu_enumerate_connected_subgraphs(G, k):
+        Same return value as `csr_from_adjacency`, with vertex ids taken from
+        `self.index`. Edges are grouped by size into (m, s) arrays of vertex
+        ids, so all ordered vertex pairs of a group are produced by s*(s-1)
+        column slices; duplicates are dropped with a single np.unique.
+        """
+        if self._csr is not None:
+            return self._csr
+        vid_of = list(self.index)
+        n = len(vid_of)
+        by_size = defaultdict(list)
+        for e in self.edges:
+            if len(e) > 1:
+                by_size[len(e)].append([self.index[v] for v in e])
+        keys = [np.zeros(0, dtype=np.int64)]
+        for size, rows in by_size.items():
+            ids = np.array(rows, dtype=np.int64)
+            for i, j in permutations(range(size), 2):
+                keys.append(ids[:, i] * n + ids[:, j])
+        keys = np.unique(np.concatenate(keys))
+        indptr = np.zeros(n + 1, dtype=np.int32)
+        np.cumsum(np.bincount(keys // n, minlength=n), out=indptr[1:])
+        indices = (keys % n).astype(np.int32)
+        self._csr = (indptr, indices, vid_of, dict(self.index))
+        return self._csr
+
+    def incidence_csr(self):
+        """Return the vertex-edge incidence in CSR form over `self.index` ids.
+
+        Returns (vptr, vedges, eptr, everts) as int32 arrays: the edges
+        incident to vertex i are vedges[vptr[i]:vptr[i+1]] and the vertices
+        of edge j are everts[eptr[j]:eptr[j+1]].
+        """
+        if self._incidence_csr is not None:
+            return self._incidence_csr
+        index, incidence = self.index, self.incidence
+        vptr = np.zeros(len(index) + 1, dtype=np.int32)
+        vptr[1:] = np.cumsum([len(incidence[v]) for v in index])
+        vedges = np.fromiter(chain.from_iterable(incidence[v] for v in index),
+                             dtype=np.int32, count=vptr[-1])
+        eptr = np.zeros(len(self.edges) + 1, dtype=np.int32)
+        eptr[1:] = np.cumsum([len(e) for e in self.edges])
+        everts = np.fromiter((index[v] for e in self.edges for v in e),
+                             dtype=np.int32, count=eptr[-1])
+        self._incidence_csr = (vptr, vedges, eptr, everts)
+        return self._incidence_csr
+
+
+def csr_from_adjacency(G):
+    """Convert an adjacency dict to CSR arrays.
+
+    Vertices get dense ids 0..n-1 in the same deterministic order ESU uses.
+    Returns (indptr: int32[n+1], indices: int32[nnz], vid_of: list of
+    vertices by id, id_of_v: dict vertex -> id); the neighbours of vertex
+    i are indices[indptr[i]:indptr[i+1]], sorted by id.
+    """
+    vid_of = sorted(G.keys(), key=lambda v: (-len(G[v]), str(v)))
+    id_of_v = {v: i for i, v in enumerate(vid_of)}
+    indptr = np.zeros(len(vid_of) + 1, dtype=np.int32)
+    indices = []
+    for i, v in enumerate(vid_of):
+        nbs = sorted(id_of_v[u] for u in G[v])
+        indices.extend(nbs)
+        indptr[i + 1] = len(indices)
+    return indptr, np.array(indices, dtype=np.int32), vid_of, id_of_v
+
+
+def esu_enumerate_connected_subgraphs(G, k, roots=None):
     """ESU enumerator for connected induced subgraphs of size k.
 
     G: dict vertex -> set(neighbors)
+    roots: optional iterable of start vertices; only the vertex sets whose
+        first vertex in the ESU ordering is one of them are produced, so
+        disjoint root sets split the enumeration into disjoint parts
     Returns a generator of frozenset vertex sets of size k.
 
     Implementation: classic ESU: for each start vertex v (ordered),
     grow subgraphs using an extension set containing neighbors with id > start
-    to avoid duplicates. We assume vertex ids are comparable; if not, we
-    will map to a sorted list.
+    that are exclusive to the newly added vertex (not in or adjacent to the
+    current subgraph), so each vertex set is produced exactly once. We assume
+    vertex ids are comparable; if not, we will map to a sorted list.
+
+    Any total order of the vertices gives the same vertex sets. Ordering by
+    descending degree puts hubs first, so later roots exclude them from
+    their extensions and their long neighbour lists are rarely scanned.
+
+    The subgraph lives in one preallocated list of size k filled up to
+    `depth`. Within a root, each candidate vertex (id > start) gets a local
+    bit when first reached, and both the extension set and the closed
+    neighbourhood of the subgraph are ints over those bits, so extending
+    needs no set or list copies. Local bits keep the ints as small as the
+    neighbourhood being explored, whatever the size of G.
+
+    Uses the compiled CSR kernel when numba is available and no roots are given.
     """
-    # create a deterministic ordering
-    vertices = sorted(G.keys(), key=lambda x: str(x))
+    if esu_csr is not None and roots is None:
+        yield from _enumerate_csr(esu_csr, csr_from_adjacency(G), k)
+        return
+    # create a deterministic ordering: by descending degree, ties by str
+    vertices = sorted(G.keys(), key=lambda v: (-len(G[v]), str(v)))
     index = {v: i for i, v in enumerate(vertices)}
+    subgraph = [None] * k
+
+    def rec(depth, ext, closed):
+        while ext:
+            low = ext & -ext
+            ext ^= low
+            w = local_verts[low.bit_length() - 1]
+            subgraph[depth] = w
+            if depth + 1 == k:
+                yield frozenset(subgraph)
+                continue
+            # new extension: candidate neighbors of w outside the closed neighborhood
+            new_ext = ext
+            new_closed = closed
+            for nb in G[w]:
+                bit = local_bit.get(nb)
+                if bit is None:
+                    if index[nb] <= start:
+                        continue
+                    bit = local_bit[nb] = 1 << len(local_verts)
+                    local_verts.append(nb)
+                if not closed & bit:
+                    new_ext |= bit
+                new_closed |= bit
+            yield from rec(depth + 1, new_ext, new_closed)
+
+    for v in (vertices if roots is None else roots):
+        # extension contains neighbors of v with index > index[v]
+        start = index[v]
+        local_verts = [nb for nb in G[v] if index[nb] > start]
+        local_bit = {nb: 1 << i for i, nb in enumerate(local_verts)}
+        ext = (1 << len(local_verts)) - 1
+        subgraph[0] = v
+        yield from rec(1, ext, ext)
 
-    def rec(subgraph, ext, start):
-        if len(subgraph) == k:
-            yield frozenset(subgraph)
-            return
-        # copy ext to iterate safely
-        ext_list = list(ext)
-        while ext_list:
-            w = ext_list.pop()
-            new_sub = subgraph + [w]
-            # build new extension: neighbors of w with index > start and not already in subgraph
-            new_ext = set(ext_list)
-            for nb in G.get(w, []):
-                if nb in new_sub:
-                    continue
-                if index[nb] > index[start]:
-                    new_ext.add(nb)
-            yield from rec(new_sub, new_ext, start)
 
+def enumerate_connected_triples(G):
+    """Enumerate connected 3-vertex sets of G, each exactly once.
+
+    Every connected triple is either a triangle or an open wedge u-v-w with
+    a unique centre v. For each centre the pairs of its neighbours are
+    scanned: non-adjacent pairs are wedges and adjacent pairs are triangles,
+    kept only when the centre is the smallest vertex of the triangle. This
+    avoids the ESU recursion entirely.
+
+    Uses the compiled CSR kernel when numba is available.
+    """
+    if triples_csr is not None:
+        yield from _enumerate_csr(triples_csr, csr_from_adjacency(G), 3)
+        return
+    vertices = sorted(G.keys(), key=lambda x: str(x))
+    index = {v: i for i, v in enumerate(vertices)}
     for v in vertices:
-        # extension contains neighbors of v with index > index[v]
-        ext = set(nb for nb in G[v] if index[nb] > index[v])
-        yield from rec([v], ext, v)
+        nbs = sorted(G[v], key=index.__getitem__)
+        for i, u in enumerate(nbs):
+            Gu = G[u]
+            for w in nbs[i + 1:]:
+                if w not in Gu or index[v] < index[u]:
+                    yield frozenset((u, v, w))
+
+
+def _enumerate_csr(kernel, csr, k, chunk=1 << 16):
+    """Drive a CSR enumeration kernel over csr, yielding frozenset vertex sets of size k.
+
+    Rows are collected in a preallocated buffer which is flushed whenever
+    full, and doubled when a single start vertex does not fit.
+    """
+    indptr, indices, vid_of, _ = csr
+    n = len(vid_of)
+    out_buf = np.empty((chunk, k), dtype=np.int32)
+    root = 0
+    while root < n:
+        rows, root = kernel(indptr, indices, root, out_buf)
+        if rows == 0 and root < n:
+            out_buf = np.empty((2 * len(out_buf), k), dtype=np.int32)
+            continue
+        for row in out_buf[:rows].tolist():
+            yield frozenset(vid_of[i] for i in row)
+
+
+def _projection_subsets(H, k, triples=False):
+    """Enumerate connected k-vertex sets of H's projection.
+
+    With numba the CSR is built straight from H's edges, skipping the dict
+    projection. triples=True uses `enumerate_connected_triples` (k=3 only)
+    instead of ESU.
+    """
+    kernel = triples_csr if triples else esu_csr
+    if kernel is not None:
+        return _enumerate_csr(kernel, H.to_csr(), k)
+    G = H.projection_2_section()
+    if triples:
+        return enumerate_connected_triples(G)
+    return esu_enumerate_connected_subgraphs(G, k)
 
 
 def is_connected_hypergraph(H):
@@ -110,28 +382,60 @@ def is_connected_hypergraph(H):
     """
     if not H.vertices:
         return True
+    # the cached vertex -> edge index lists, built once per hypergraph
+    edges, incidence = H.edges, H.incidence
     start = next(iter(H.vertices))
-    visited = set([start])
+    visited = {start}
     q = deque([start])
-    # build incidence: vertex -> list of edges (as sets)
-    incidence = defaultdict(list)
-    for e in H.edges:
-        for v in e:
-            incidence[v].append(e)
-
     while q:
         v = q.popleft()
-        for e in incidence.get(v, ()):  # for each edge containing v
-            for u in e:
-                if u not in visited:
-                    visited.add(u)
-                    q.append(u)
-    return visited == set(H.vertices)
+        for idx in incidence.get(v, ()):  # for each edge containing v
+            new = edges[idx] - visited
+            visited |= new
+            q.extend(new)
+    return len(visited) == len(H.vertices)
+
+
+def spans_connected(masks, k):
+    """Check that edge bitmasks over vertices 0..k-1 connect all k vertices.
+
+    Replaces the BFS of `is_connected_hypergraph` for motif candidates: the
+    component of the first edge is grown by OR-ing in every mask sharing a
+    bit with it, which settles in at most k passes.
+    """
+    full = (1 << k) - 1
+    if not masks:
+        return False
+    comp = masks[0]
+    changed = True
+    while changed and comp != full:
+        changed = False
+        for m in masks:
+            if m & comp and m | comp != comp:
+                comp |= m
+                changed = True
+    return comp == full
 
 
 def canonical_form_hypergraph(H):
     """Return a canonical string representation for small hypergraphs (k<=4).
 
+    Looks up the signature of H in the class table; hypergraphs outside it
+    (more than 4 vertices, repeated or single-vertex edges) fall back to
+    `_canonical_form_brute`.
+    """
+    if len(H.vertices) <= 4:
+        pos = {v: i for i, v in enumerate(H.vertices)}
+        sig = tuple(sorted(sum(1 << pos[v] for v in e) for e in H.edges))
+        cid = _SIGNATURE_TABLE.get(sig)
+        if cid is not None:
+            return CLASS_NAMES[cid]
+    return _canonical_form_brute(H)
+
+
+def _canonical_form_brute(H):
+    """Canonical string representation by trying every vertex labelling.
+
     Approach: consider vertex set V of size k, list all permutations of V
     mapping to [0..k-1]; for each permutation produce a sorted tuple of
     sorted hyperedges (as tuples of new labels). Choose lexicographically
@@ -159,73 +463,267 @@ def canonical_form_hypergraph(H):
     return json.dumps(best)
 
 
-def baseline_count(H, k=3):
+def _masks_hypergraph(masks):
+    """Build a Hypergraph on vertices 0..3 from a sequence of edge bitmasks."""
+    return Hypergraph([[i for i in range(4) if m >> i & 1] for m in masks])
+
+
+def _permute_mask(mask, perm):
+    out = 0
+    for i, j in enumerate(perm):
+        if mask >> i & 1:
+            out |= 1 << j
+    return out
+
+
+def _expand_signatures(signatures, k=4):
+    """Map every relabelling of each class signature to that class id."""
+    perms = list(permutations(range(k)))
+    table = {}
+    for cid, sig in enumerate(signatures):
+        for perm in perms:
+            table[tuple(sorted(_permute_mask(m, perm) for m in sig))] = cid
+    return table
+
+
+def _build_class_table(k=4):
+    """Find the motif classes of all sets of distinct edges (size >= 2) on k vertices.
+
+    Signatures are enumerated one isomorphism class at a time: the
+    brute-force canonicalizer runs once per class and its relabellings are
+    skipped. Since the canonical form only depends on the edges, the k=4
+    classes also cover all k=3 signatures.
+    Returns (signatures: one per class id, names: canonical form per id).
+    """
+    masks = [m for m in range(1, 1 << k) if bin(m).count("1") >= 2]
+    seen = {}
+    signatures = []
+    names = []
+    for r in range(len(masks) + 1):
+        for subset in combinations(masks, r):
+            if subset in seen:
+                continue
+            seen.update(_expand_signatures([subset], k))
+            signatures.append(subset)
+            names.append(_canonical_form_brute(_masks_hypergraph(subset)))
+    return signatures, names
+
+
+def write_class_module(path):
+    """Regenerate `src/_motif_classes.py` with the brute-force canonicalizer."""
+    signatures, names = _build_class_table()
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('"""Motif classes on at most 4 vertices.\n\n'
+                'Generated by scripts/generate_motif_classes.py; do not edit.\n'
+                'CLASS_SIGNATURES[i] is one signature (sorted tuple of edge bitmasks)\n'
+                'of class i and CLASS_NAMES[i] its canonical form.\n"""\n')
+        f.write('CLASS_SIGNATURES = [\n')
+        for sig in signatures:
+            f.write(f'    {sig!r},\n')
+        f.write(']\n\nCLASS_NAMES = [\n')
+        for name in names:
+            f.write(f'    {name!r},\n')
+        f.write(']\n')
+
+
+if CLASS_SIGNATURES is None:
+    CLASS_SIGNATURES, CLASS_NAMES = _build_class_table()
+_SIGNATURE_TABLE = _expand_signatures(CLASS_SIGNATURES)
+NUM_MOTIF_CLASSES = len(CLASS_NAMES)
+
+# class of a 4-set whose only induced edge is the 4-set itself
+CID_SIZE4 = _SIGNATURE_TABLE[(0b1111,)]
+
+# canonical forms of signatures outside the table, memoized
+_EXTRA_FORMS = {}
+
+
+def canonical_form_signature(sig):
+    """Return the canonical form for a signature (sorted tuple of edge bitmasks).
+
+    Signatures missing from the precomputed table (repeated or single-vertex
+    edges) are canonicalized by brute force once and memoized.
+    """
+    cid = _SIGNATURE_TABLE.get(sig)
+    if cid is not None:
+        return CLASS_NAMES[cid]
+    Cm = _EXTRA_FORMS.get(sig)
+    if Cm is None:
+        Cm = _EXTRA_FORMS[sig] = _canonical_form_brute(_masks_hypergraph(sig))
+    return Cm
+
+
+def _tally(M, extra, sig):
+    """Count one motif: by class id in the list M, or by canonical form in
+    extra for the rare signatures outside the table."""
+    cid = _SIGNATURE_TABLE.get(sig)
+    if cid is None:
+        extra[canonical_form_signature(sig)] += 1
+    else:
+        M[cid] += 1
+
+
+def _motif_counts(M, extra):
+    """Turn the class-id counts of `_tally` into the canonical form -> count dict."""
+    counts = {CLASS_NAMES[cid]: c for cid, c in enumerate(M) if c}
+    counts.update(extra)
+    return counts
+
+
+_CODE_TABLES = {}
+
+
+def _code_table(k):
+    """Return the (slot, lut) tables used by `esu_count_csr` for order k.
+
+    slot maps each edge mask of size >= 2 over k vertices to a bit of a set
+    code; lut maps every code to its class id, or to -1 when its edges do
+    not connect all k vertices.
+    """
+    if k not in _CODE_TABLES:
+        masks = [m for m in range(1, 1 << k) if bin(m).count("1") >= 2]
+        slot = np.full(1 << k, -1, dtype=np.int64)
+        for i, m in enumerate(masks):
+            slot[m] = i
+        lut = np.full(1 << len(masks), -1, dtype=np.int64)
+        for code in range(len(lut)):
+            sig = tuple(m for i, m in enumerate(masks) if code >> i & 1)
+            if spans_connected(sig, k):
+                lut[code] = _SIGNATURE_TABLE[sig]
+        _CODE_TABLES[k] = (slot, lut)
+    return _CODE_TABLES[k]
+
+
+def _class_counts(H, k, vertex_sets):
+    """Count the motif classes of the given k-vertex sets of H.
+
+    Returns the per-class-id count list and the Counter of overflow
+    classes, as filled by `_tally`.
+    """
+    M = [0] * NUM_MOTIF_CLASSES
+    extra = Counter()
+    for Vstar in vertex_sets:
+        masks = H.induced_edges(Vstar)
+        if spans_connected(masks, k):
+            _tally(M, extra, tuple(sorted(masks)))
+    return M, extra
+
+
+def _count_vertex_sets(H, k, vertex_sets):
+    """Count the motif classes of the given k-vertex sets of H."""
+    return _motif_counts(*_class_counts(H, k, vertex_sets))
+
+
+_WORKER_STATE = None
+
+
+def _init_baseline_worker(H, k):
+    global _WORKER_STATE
+    _WORKER_STATE = (H, H.projection_2_section(), k)
+
+
+def _baseline_worker(roots):
+    H, G, k = _WORKER_STATE
+    return _class_counts(H, k, esu_enumerate_connected_subgraphs(G, k, roots=roots))
+
+
+def _baseline_count_pool(H, k, workers):
+    """Run the baseline count with ESU roots dealt round-robin to worker processes.
+
+    Each chunk comes back as a row of class-id counts (plus its overflow
+    classes); the rows are summed in one numpy reduction, as in
+    `esu_count_csr`, before the canonical forms are looked up.
+
+    Workers are spawned rather than forked: the parallel numba kernels run
+    on a threading layer (TBB) that does not survive a fork, and forking
+    after `esu_count_csr` has run hangs the parent at exit. Like any spawn
+    pool, this needs callers' scripts to guard their entry point with
+    `if __name__ == "__main__":`.
+    """
+    vertices = sorted(H.vertices, key=lambda x: str(x))
+    n_chunks = 4 * workers
+    chunks = [vertices[i::n_chunks] for i in range(n_chunks)]
+    counts = np.zeros((n_chunks, NUM_MOTIF_CLASSES), dtype=np.int64)
+    extra = Counter()
+    with ProcessPoolExecutor(max_workers=workers,
+                             mp_context=multiprocessing.get_context("spawn"),
+                             initializer=_init_baseline_worker, initargs=(H, k)) as pool:
+        for c, (M, part_extra) in enumerate(pool.map(_baseline_worker, chunks)):
+            counts[c] = M
+            extra.update(part_extra)
+    return _motif_counts(counts.sum(axis=0).tolist(), extra)
+
+
+def baseline_count(H, k=3, workers=1):
     """Implement Algorithm 1 Baseline: count motif frequencies of order k in hypergraph H.
 
     Steps:
     1) project H to graph G
     2) enumerate connected k-node induced subgraphs of G using ESU
-    3) for each vertex set, build induced sub-hypergraph from H, check
-       hypergraph connectivity, compute isomorphism class, and count
+    3) for each vertex set, collect the induced edges of H as bitmasks, check
+       that they connect all k vertices, compute isomorphism class, and count
+
+    With numba, and when H has no repeated or single-vertex edges, all three
+    steps run in the `esu_count_csr` kernel, in parallel over ESU roots on
+    numba's threads. Otherwise, workers > 1 splits the ESU roots across that
+    many spawned processes (see `_baseline_count_pool`; scripts calling
+    this need an `if __name__ == "__main__":` guard).
     Returns: dict mapping canonical motif representation -> count
     """
     if k not in (3, 4):
         raise ValueError("k must be 3 or 4")
-    G = H.projection_2_section()
-    M = defaultdict(int)
-    seen = 0
-    for Vstar in esu_enumerate_connected_subgraphs(G, k):
-        seen += 1
-        candidate = H.induced_subhypergraph(Vstar)
-        if is_connected_hypergraph(candidate):
-            Cm = canonical_form_hypergraph(candidate)
-            M[Cm] += 1
-    # optionally return metadata
-    return dict(M)
+    simple = 1 not in H.edges_by_size and len(set(H.edges)) == len(H.edges)
+    if esu_count_csr is not None and simple:
+        indptr, indices, _, _ = H.to_csr()
+        slot, lut = _code_table(k)
+        counts = esu_count_csr(indptr, indices, *H.incidence_csr(), k, slot, lut,
+                               NUM_MOTIF_CLASSES, 4 * get_num_threads())
+        return _motif_counts(counts.tolist(), {})
+    if workers > 1:
+        return _baseline_count_pool(H, k, workers)
+    return _count_vertex_sets(H, k, _projection_subsets(H, k))
 
 
 def efficient_count_order3(H):
     """Efficient Algorithm 2 for counting motifs of order 3.
 
     Steps implemented:
-    1) Count all hyperedges of size 3 directly (each such edge induces a motif on its 3 vertices).
-    2) Remove all size-3 hyperedges from H to form G.
-    3) Enumerate connected 3-vertex induced subgraphs of G's projection using ESU.
-       For each vertex set V* not already counted, build the induced sub-hypergraph
-       from G (i.e., without the original size-3 hyperedges), check hypergraph
-       connectivity, canonicalize and count.
+    1) Enumerate the connected 3-vertex sets of H's projection directly as
+       triangles and open wedges (`enumerate_connected_triples`) instead of
+       running ESU. Each set is produced once, so size-3 hyperedges need no
+       separate pass or visited set: they are found as triangles.
+    2) For each vertex set V*, collect the induced edges from the original H,
+       check that they connect all 3 vertices, canonicalize and count. On 3
+       vertices any two edges of size >= 2 intersect, so this holds exactly
+       when those edges cover all three vertices.
 
     Returns: dict mapping canonical motif representation -> count
     """
-    M = defaultdict(int)
-    visited = set()
+    M = [0] * NUM_MOTIF_CLASSES
+    extra = Counter()
 
-    # 1) count direct hyperedges of size 3
-    for e in H.edges:
-        if len(e) == 3:
-            Vstar = frozenset(e)
-            candidate = H.induced_subhypergraph(Vstar)
-            # canonicalize and count
-            Cm = canonical_form_hypergraph(candidate)
-            M[Cm] += 1
-            visited.add(Vstar)
-
-    # 2/3) enumerate connected 3-vertex induced subgraphs in projection of the
-    # original hypergraph H (this matches the baseline ESU enumeration) and
-    # skip triples already counted. Build induced candidates from the original
-    # H so trimmed edges from size-3 hyperedges remain.
-    G_proj = H.projection_2_section()
-    for Vstar in esu_enumerate_connected_subgraphs(G_proj, 3):
-        Vf = frozenset(Vstar)
-        if Vf in visited:
-            continue
-        candidate = H.induced_subhypergraph(Vstar)
-        if is_connected_hypergraph(candidate):
-            Cm = canonical_form_hypergraph(candidate)
-            M[Cm] += 1
-            visited.add(Vf)
+    for Vstar in _projection_subsets(H, 3, triples=True):
+        masks = H.induced_edges(Vstar)
+        cover = 0
+        for m in masks:
+            if m & (m - 1):
+                cover |= m
+        if cover == 0b111:
+            _tally(M, extra, tuple(sorted(masks)))
+
+    return _motif_counts(M, extra)
 
-    return dict(M)
+
+def _vertex_set_key(index, n, Vstar):
+    """Encode a vertex set as one int: its sorted dense ids as base-n digits.
+
+    Used for visited sets, where an int takes a fraction of the memory of a
+    frozenset; a bitmask over dense ids would grow with the largest id.
+    """
+    key = 0
+    for i in sorted([index[v] for v in Vstar]):
+        key = key * n + i
+    return key
 
 
 def efficient_count_order4(H):
@@ -233,66 +731,68 @@ def efficient_count_order4(H):
 
     Implements the steps from Algorithm 3:
     1) Count all hyperedges of size 4 directly.
-    2) Remove size-4 edges; for each remaining size-3 edge e, look at
-       all adjacent hyperedges ei. If |e ∪ ei| == 4 and that 4-set
-       hasn't been visited, build the induced sub-hypergraph and count it.
+    2) Ignoring size-4 edges, for each size-3 edge e look at the adjacent
+       hyperedges ei (found through the incidence lists of e's vertices).
+       If |e ∪ ei| == 4 and that 4-set hasn't been visited, collect its
+       induced edges and count it.
     3) Remove size-3 edges and run ESU on the projection to enumerate
        connected 4-vertex induced subgraphs; for any 4-set not visited
        count its canonical motif.
 
+    Visited 4-sets are stored as ints (see `_vertex_set_key`). ESU yields
+    each 4-set once, so only the sets counted in steps 1 and 2 are stored.
+
     Returns: dict mapping canonical motif representation -> count
     """
-    M = defaultdict(int)
+    M = [0] * NUM_MOTIF_CLASSES
+    extra = Counter()
     visited = set()
+    index, n = H.index, len(H.index)
+    incidence = H.incidence
 
     # 1) count direct hyperedges of size 4
-    for e in H.edges:
-        if len(e) == 4:
-            Vstar = frozenset(e)
-            candidate = H.induced_subhypergraph(Vstar)
-            Cm = canonical_form_hypergraph(candidate)
-            M[Cm] += 1
-            visited.add(Vstar)
-
-    # 2) remove size-4 edges
-    edges_no4 = [e for e in H.edges if len(e) != 4]
-    H_no4 = Hypergraph(edges_no4)
-
-    # for each size-3 edge, look at adjacent hyperedges in H_no4
-    size3_edges = [e for e in H_no4.edges if len(e) == 3]
-    if size3_edges:
-        for e in size3_edges:
-            for ei in H_no4.edges:
-                if ei is e:
-                    continue
-                if not (ei & e):
-                    continue
-                union = e | ei
-                if len(union) == 4:
-                    Vf = frozenset(union)
-                    if Vf in visited:
-                        continue
-                    # build induced candidate from the original H (to match baseline semantics)
-                    candidate = H.induced_subhypergraph(union)
-                    if is_connected_hypergraph(candidate):
-                        Cm = canonical_form_hypergraph(candidate)
-                        M[Cm] += 1
-                        visited.add(Vf)
+    for e_id in H.edges_by_size.get(4, ()):
+        Vstar = H.edges[e_id]
+        key = _vertex_set_key(index, n, Vstar)
+        if key in visited:
+            continue
+        visited.add(key)
+        if all(len(incidence[v]) == 1 for v in Vstar):
+            # no other edge touches the 4-set
+            M[CID_SIZE4] += 1
+            continue
+        _tally(M, extra, tuple(sorted(H.induced_edges(Vstar))))
+
+    # 2) for each size-3 edge, look at adjacent hyperedges other than size-4 ones
+    for e_id in H.edges_by_size.get(3, ()):
+        e = H.edges[e_id]
+        adj_edge_ids = set().union(*(incidence[v] for v in e))
+        for ei_id in adj_edge_ids:
+            ei = H.edges[ei_id]
+            if ei_id == e_id or len(ei) == 4:
+                continue
+            union = e | ei
+            if len(union) != 4:
+                continue
+            key = _vertex_set_key(index, n, union)
+            if key in visited:
+                continue
+            # take induced edges from the original H (to match baseline semantics)
+            masks = H.induced_edges(union)
+            if spans_connected(masks, 4):
+                _tally(M, extra, tuple(sorted(masks)))
+                visited.add(key)
 
     # 3) enumerate connected 4-vertex induced subgraphs in projection of original H
     # (use original projection to match baseline enumeration), skip visited
-    G_proj = H.projection_2_section()
-    for Vstar in esu_enumerate_connected_subgraphs(G_proj, 4):
-        Vf = frozenset(Vstar)
-        if Vf in visited:
+    for Vstar in _projection_subsets(H, 4):
+        if visited and _vertex_set_key(index, n, Vstar) in visited:
             continue
-        candidate = H.induced_subhypergraph(Vstar)
-        if is_connected_hypergraph(candidate):
-            Cm = canonical_form_hypergraph(candidate)
-            M[Cm] += 1
-            visited.add(Vf)
+        masks = H.induced_edges(Vstar)
+        if spans_connected(masks, 4):
+            _tally(M, extra, tuple(sorted(masks)))
 
-    return dict(M)
+    return _motif_counts(M, extra)
 
 
 def _example_hypergraph():